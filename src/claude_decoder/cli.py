@@ -4,12 +4,15 @@
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
+import os
 import sys
+from operator import attrgetter
 from pathlib import Path
 
 from .extract import extract_project
-from .models import list_session_files
+from .models import json_loads, list_session_files, session_mapper
 from .reconstruct import (
     RestorePlan,
     plan_restore, execute_restore, write_patch,
@@ -21,26 +24,57 @@ class ProjectNotFoundError(Exception):
     pass
 
 
+# Bytes read up front from a session log when looking for its cwd
+_CWD_SCAN_BYTES = 64 * 1024
+
+
 def _read_cwd_from_project(project_dir: Path) -> str | None:
-    """Read the real project path from the first JSONL entry's cwd field."""
-    for jsonl in list_session_files(project_dir):
-        with open(jsonl, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-                try:
-                    data = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-                cwd = data.get("cwd", "")
+    """Read the real project path from the first JSONL entry's cwd field.
+
+    Every entry in a project shares the same cwd, so this stops at the first hit.
+    Leading entries without one (summaries, file-history snapshots) are skipped
+    without being decoded. For the same reason any session file will do, so the
+    directory is walked lazily in listing order rather than stat'ed and sorted.
+    """
+    with os.scandir(project_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".jsonl"):
+                cwd = _read_cwd_from_session(entry.path)
                 if cwd:
                     return cwd
     return None
 
 
-def find_claude_project_dir(project_path: str) -> Path:
-    """Auto-detect the Claude project directory for a given project path.
+def _read_cwd_from_session(jsonl: str) -> str | None:
+    """Return the first non-empty cwd recorded in a session file, if any."""
+    with open(jsonl, "rb") as f:
+        # The cwd is almost always within the first few lines: grab one block and split
+        # it in one go, completing the trailing partial line before falling back to readline.
+        *head, partial = f.read(_CWD_SCAN_BYTES).split(b"\n")
+        head.append(partial + f.readline())
+        for line in itertools.chain(head, f):
+            # Lines that pass this filter are never blank, and the decoder
+            # ignores the surrounding whitespace, so no strip() is needed.
+            if b'"cwd"' not in line:
+                continue
+            try:
+                data = json_loads(line)
+            except json.JSONDecodeError:
+                continue
+            cwd = data.get("cwd", "")
+            if cwd:
+                return cwd
+    return None
+
+
+def _resolve_once(project_path: str) -> tuple[Path, str]:
+    """Resolve a user-supplied project path, returning both its Path and str forms."""
+    resolved = Path(project_path).resolve()
+    return resolved, str(resolved)
+
+
+def find_claude_project_dir(resolved: Path) -> Path:
+    """Auto-detect the Claude project directory for an already-resolved project path.
 
     Mangles the absolute path by replacing / with - to match
     ~/.claude/projects/<mangled>/ naming convention.
@@ -51,8 +85,8 @@ def find_claude_project_dir(project_path: str) -> Path:
     Raises:
         ProjectNotFoundError: if no matching project directory is found.
     """
-    resolved = Path(project_path).resolve()
-    mangled = str(resolved).replace("/", "-")
+    resolved_str = str(resolved)
+    mangled = resolved_str.replace("/", "-")
     claude_dir = Path.home() / ".claude" / "projects" / mangled
     if claude_dir.exists():
         return claude_dir
@@ -60,20 +94,22 @@ def find_claude_project_dir(project_path: str) -> Path:
     # Fallback: search project dirs by matching cwd from JSONL entries
     projects_dir = Path.home() / ".claude" / "projects"
     available: list[str] = []
-    resolved_str = str(resolved)
     if projects_dir.exists():
-        for p in sorted(projects_dir.iterdir()):
-            if not p.is_dir():
-                continue
+        # scandir's DirEntry.is_dir() uses the d_type from readdir, saving a stat per child
+        with os.scandir(projects_dir) as it:
+            entries = [e for e in it if e.is_dir()]
+        entries.sort(key=attrgetter("name"))
+        for e in entries:
+            p = Path(e.path)
             real_path = _read_cwd_from_project(p)
             if real_path:
                 if real_path == resolved_str:
                     return p
                 available.append(f"  {real_path}")
             else:
-                available.append(f"  {p.name}")
+                available.append(f"  {e.name}")
 
-    msg = f"No Claude data found for {resolved}\nExpected: {claude_dir}\n"
+    msg = f"No Claude data found for {resolved_str}\nExpected: {claude_dir}\n"
     if available:
         msg += "\nAvailable projects:\n" + "\n".join(available)
     raise ProjectNotFoundError(msg)
@@ -110,8 +146,8 @@ def _print_plan(plan: RestorePlan) -> None:
 
 def cmd_restore(args: argparse.Namespace) -> str | None:
     """Handle the restore subcommand. Returns a status message or None."""
-    project_path = str(Path(args.project_path).resolve())
-    claude_dir = find_claude_project_dir(project_path)
+    resolved, project_path = _resolve_once(args.project_path)
+    claude_dir = find_claude_project_dir(resolved)
 
     if args.dump_operations:
         if args.output or args.patch or args.in_place:
@@ -166,12 +202,21 @@ def cmd_restore(args: argparse.Namespace) -> str | None:
     return run_restore_interactive(plan)
 
 
+def _render_session_job(job: tuple[str, str, bool]) -> str:
+    """Render one (jsonl_path, output_path, truncate) job. Top-level so worker processes can pickle it."""
+    from .conversation import render_session
+
+    jsonl_path, output_path, truncate = job
+    render_session(jsonl_path, output_path, truncate=truncate)
+    return output_path
+
+
 def cmd_chat(args: argparse.Namespace) -> None:
     """Handle the chat subcommand."""
     from .conversation import render_session as render_conversation
 
-    project_path = str(Path(args.project_path).resolve())
-    claude_dir = find_claude_project_dir(project_path)
+    resolved, project_path = _resolve_once(args.project_path)
+    claude_dir = find_claude_project_dir(resolved)
 
     # Collect session files
     jsonl_files = list_session_files(claude_dir)
@@ -189,12 +234,13 @@ def cmd_chat(args: argparse.Namespace) -> None:
 
         if args.session:
             # Single session by ID
-            matches = [f for f in jsonl_files if f.stem == args.session]
-            if not matches:
+            sessions_by_id = {f.stem: f for f in jsonl_files}
+            match = sessions_by_id.get(args.session)
+            if match is None:
                 print(f"Session not found: {args.session}", file=sys.stderr)
                 sys.exit(1)
             target = out_path if out_path.suffix else out_path / f"{args.session}.{fmt}"
-            render_conversation(str(matches[0]), str(target), truncate=truncate)
+            render_conversation(str(match), str(target), truncate=truncate)
             print(f"Written to {target}")
         elif out_path.suffix:
             # Output looks like a file — pick sessions interactively if multiple
@@ -214,10 +260,14 @@ def cmd_chat(args: argparse.Namespace) -> None:
         else:
             # Output is a directory — dump all sessions individually
             out_path.mkdir(parents=True, exist_ok=True)
-            for jsonl_path in jsonl_files:
-                target = out_path / f"{jsonl_path.stem}.{fmt}"
-                render_conversation(str(jsonl_path), str(target), truncate=truncate)
-                print(f"  {target.name}")
+            jobs = [
+                (str(jsonl_path), str(out_path / f"{jsonl_path.stem}.{fmt}"), truncate)
+                for jsonl_path in jsonl_files
+            ]
+            # Sessions are independent, so large projects render them across cores
+            with session_mapper(jsonl_files) as mapper:
+                for target in mapper(_render_session_job, jobs):
+                    print(f"  {Path(target).name}")
             print(f"\nDumped {len(jsonl_files)} sessions to {out_path.resolve()}/")
         return
 
@@ -287,9 +337,9 @@ def main() -> None:
             if "--help" in argv or "-h" in argv:
                 print(USAGE)
                 return
-            project_path = str(Path(command).resolve())
+            resolved, project_path = _resolve_once(command)
             from .tui import run_interactive
-            claude_dir = find_claude_project_dir(project_path)
+            claude_dir = find_claude_project_dir(resolved)
             run_interactive(claude_dir, project_path)
     except ProjectNotFoundError as e:
         print(str(e), file=sys.stderr)
@@ -4,19 +4,25 @@
 Supports plain text (.txt) and HTML (.html) output formats.
 """
 
-from dataclasses import dataclass, replace
-from datetime import datetime, timezone
+import functools
+import heapq
+import io
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timezone, tzinfo
 from html import escape
+from itertools import batched, repeat
 from pathlib import Path
+from typing import TextIO
 
 from .models import (
     Entry, TextBlock, ThinkingBlock, ImageBlock, ToolUseBlock, ToolResultBlock,
-    parse_entries,
+    iter_entries, session_mapper,
 )
 
 
 def _local_tz():
-    """Get the current local timezone (computed fresh each call)."""
+    """Get the current local timezone (computed fresh each call; renderers call it once per pass)."""
     return datetime.now().astimezone().tzinfo
 
 
@@ -24,14 +30,14 @@ def _local_tz():
 # INTERMEDIATE REPRESENTATION
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolArg:
     """A single named argument to a tool invocation."""
     name: str
     value: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Block:
     """A single renderable block within a conversation turn."""
     kind: str  # "text", "thinking", "tool_use", "tool_result", "tool_result_error", "image", "system", "snapshot", "summary", "task"
@@ -42,7 +48,7 @@ class Block:
     snapshot_files: tuple[dict, ...] = ()  # For snapshot blocks
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Turn:
     """A conversation turn: one or more blocks from the same speaker at the same time."""
     timestamp: datetime | None
@@ -59,63 +65,105 @@ class Turn:
 # FORMATTING HELPERS
 # =============================================================================
 
+def _is_blank(s: str) -> bool:
+    """Same as `not s.strip()`, but stops at the first non-whitespace char instead of copying s."""
+    return not s or s.isspace()
+
+
 def _truncate(s: str, max_len: int) -> str:
-    if len(s) > max_len:
-        return s[:max_len] + "..."
-    return s
+    return s[:max_len] + "..." if len(s) > max_len else s
 
 
-def fmt_tool_input(name: str, inp: dict, truncate: bool = False) -> list[ToolArg]:
-    """Format tool input as structured args."""
-    def _t(s: str, max_len: int) -> str:
-        return _truncate(s, max_len) if truncate else s
-
-    args: list[ToolArg] = []
-
-    if name == "Bash":
-        args.append(ToolArg("command", inp.get("command", "")))
-        if inp.get("timeout"):
-            args.append(ToolArg("timeout", str(inp["timeout"])))
-    elif name == "Read":
-        args.append(ToolArg("file_path", inp.get("file_path", "")))
-        if inp.get("offset"):
-            args.append(ToolArg("offset", str(inp["offset"])))
-        if inp.get("limit"):
-            args.append(ToolArg("limit", str(inp["limit"])))
-    elif name == "Write":
-        args.append(ToolArg("file_path", inp.get("file_path", "")))
-        content = inp.get("content", "")
-        if truncate:
-            args.append(ToolArg("content", f"({len(content)} chars) {_truncate(content, 200)}"))
-        else:
-            args.append(ToolArg("content", content))
-    elif name == "Edit":
-        args.append(ToolArg("file_path", inp.get("file_path", "")))
-        args.append(ToolArg("old_string", repr(_t(inp.get("old_string", ""), 100))))
-        args.append(ToolArg("new_string", repr(_t(inp.get("new_string", ""), 100))))
-        if inp.get("replace_all"):
-            args.append(ToolArg("replace_all", "true"))
-    elif name == "Glob":
-        args.append(ToolArg("pattern", inp.get("pattern", "")))
-        if inp.get("path"):
-            args.append(ToolArg("path", inp["path"]))
-    elif name == "Grep":
-        args.append(ToolArg("pattern", inp.get("pattern", "")))
-        if inp.get("path"):
-            args.append(ToolArg("path", inp["path"]))
-        if inp.get("glob"):
-            args.append(ToolArg("glob", inp["glob"]))
-    elif name == "Task":
-        args.append(ToolArg("description", inp.get("description", "")))
-        prompt = inp.get("prompt", "")
-        args.append(ToolArg("prompt", _t(prompt, 300)))
-    else:
-        for k, v in inp.items():
-            args.append(ToolArg(k, _t(str(v), 200)))
+def _fmt_bash(inp: dict, truncate: bool) -> list[ToolArg]:
+    args = [ToolArg("command", inp.get("command", ""))]
+    if inp.get("timeout"):
+        args.append(ToolArg("timeout", str(inp["timeout"])))
+    return args
+
+
+def _fmt_read(inp: dict, truncate: bool) -> list[ToolArg]:
+    args = [ToolArg("file_path", inp.get("file_path", ""))]
+    if inp.get("offset"):
+        args.append(ToolArg("offset", str(inp["offset"])))
+    if inp.get("limit"):
+        args.append(ToolArg("limit", str(inp["limit"])))
+    return args
+
+
+def _fmt_write(inp: dict, truncate: bool) -> list[ToolArg]:
+    content = inp.get("content", "")
+    if truncate:
+        content = f"({len(content)} chars) {_truncate(content, 200)}"
+    return [ToolArg("file_path", inp.get("file_path", "")), ToolArg("content", content)]
+
+
+def _fmt_edit(inp: dict, truncate: bool) -> list[ToolArg]:
+    old_string = inp.get("old_string", "")
+    new_string = inp.get("new_string", "")
+    if truncate:
+        old_string = _truncate(old_string, 100)
+        new_string = _truncate(new_string, 100)
+    args = [
+        ToolArg("file_path", inp.get("file_path", "")),
+        ToolArg("old_string", repr(old_string)),
+        ToolArg("new_string", repr(new_string)),
+    ]
+    if inp.get("replace_all"):
+        args.append(ToolArg("replace_all", "true"))
+    return args
+
 
+def _fmt_glob(inp: dict, truncate: bool) -> list[ToolArg]:
+    args = [ToolArg("pattern", inp.get("pattern", ""))]
+    if inp.get("path"):
+        args.append(ToolArg("path", inp["path"]))
     return args
 
 
+def _fmt_grep(inp: dict, truncate: bool) -> list[ToolArg]:
+    args = [ToolArg("pattern", inp.get("pattern", ""))]
+    if inp.get("path"):
+        args.append(ToolArg("path", inp["path"]))
+    if inp.get("glob"):
+        args.append(ToolArg("glob", inp["glob"]))
+    return args
+
+
+def _fmt_task(inp: dict, truncate: bool) -> list[ToolArg]:
+    prompt = inp.get("prompt", "")
+    if truncate:
+        prompt = _truncate(prompt, 300)
+    return [ToolArg("description", inp.get("description", "")), ToolArg("prompt", prompt)]
+
+
+def _fmt_generic(inp: dict, truncate: bool) -> list[ToolArg]:
+    if not truncate:
+        return [ToolArg(k, str(v)) for k, v in inp.items()]
+    # _truncate inlined: this runs once per argument of every unknown tool call
+    args = []
+    for k, v in inp.items():
+        v = str(v)
+        args.append(ToolArg(k, v[:200] + "..." if len(v) > 200 else v))
+    return args
+
+
+# Tool name -> formatter; anything else falls back to _fmt_generic
+_TOOL_FORMATTERS = {
+    "Bash": _fmt_bash,
+    "Read": _fmt_read,
+    "Write": _fmt_write,
+    "Edit": _fmt_edit,
+    "Glob": _fmt_glob,
+    "Grep": _fmt_grep,
+    "Task": _fmt_task,
+}
+
+
+def fmt_tool_input(name: str, inp: dict, truncate: bool = False) -> list[ToolArg]:
+    """Format tool input as structured args."""
+    return _TOOL_FORMATTERS.get(name, _fmt_generic)(inp, truncate)
+
+
 def fmt_tool_result(content: str, truncate: bool = False) -> str:
     """Format tool result content."""
     if truncate and len(content) > 500:
@@ -170,28 +218,16 @@ def parse_entry(entry: Entry, truncate: bool = False) -> Turn | None:
 
     role = entry.message.role
 
-    has_text = any(
-        isinstance(b, TextBlock) and b.text.strip()
-        for b in entry.message.content
-    )
-    has_tool_result = any(
-        isinstance(b, ToolResultBlock)
-        for b in entry.message.content
-    )
-
-    if role == "user" and has_tool_result and not has_text:
-        speaker = "TOOL"
-    elif role == "user":
-        speaker = "USER"
-    else:
-        speaker = "CLAUDE"
-
+    # Single walk over the content: build blocks and note what kinds we saw
     blocks: list[Block] = []
+    has_text = False
+    has_tool_result = False
 
     for block in entry.message.content:
         if isinstance(block, TextBlock):
             t = block.text.strip()
             if t:
+                has_text = True
                 blocks.append(Block(kind="text", content=t))
 
         elif isinstance(block, ThinkingBlock):
@@ -200,7 +236,9 @@ def parse_entry(entry: Entry, truncate: bool = False) -> Turn | None:
                 blocks.append(Block(kind="thinking", content=t))
 
         elif isinstance(block, ImageBlock):
-            media = block.source.get("media_type", "image")
+            media = block.media_type or "image"
+            if block.size:
+                media = f"{media}, {block.size} bytes"
             blocks.append(Block(kind="image", content=media))
 
         elif isinstance(block, ToolUseBlock):
@@ -214,6 +252,7 @@ def parse_entry(entry: Entry, truncate: bool = False) -> Turn | None:
             ))
 
         elif isinstance(block, ToolResultBlock):
+            has_tool_result = True
             kind = "tool_result_error" if block.is_error else "tool_result"
             formatted = fmt_tool_result(block.content, truncate=truncate)
             blocks.append(Block(kind=kind, content=formatted, tool_use_id=block.tool_use_id))
@@ -221,6 +260,13 @@ def parse_entry(entry: Entry, truncate: bool = False) -> Turn | None:
     if not blocks:
         return None
 
+    if role == "user" and has_tool_result and not has_text:
+        speaker = "TOOL"
+    elif role == "user":
+        speaker = "USER"
+    else:
+        speaker = "CLAUDE"
+
     # Populate metadata on Turn for user/assistant entries
     model = ""
     stop_reason = ""
@@ -237,79 +283,171 @@ def parse_entry(entry: Entry, truncate: bool = False) -> Turn | None:
     )
 
 
-def parse_session_turns(jsonl_path: str, truncate: bool = False) -> list[Turn]:
-    """Parse a JSONL session file into a list of Turns."""
+def iter_session_turns(jsonl_path: str, truncate: bool = False) -> Iterator[Turn]:
+    """Lazily parse a JSONL session file into Turns, one entry at a time."""
     session_id_fallback = Path(jsonl_path).stem
-    turns: list[Turn] = []
 
-    for entry in parse_entries(jsonl_path):
+    for entry in iter_entries(jsonl_path):
         if not entry.session_id:
             entry = replace(entry, session_id=session_id_fallback)
         turn = parse_entry(entry, truncate=truncate)
         if turn:
-            turns.append(turn)
+            yield turn
+
 
-    return turns
+def parse_session_turns(jsonl_path: str, truncate: bool = False) -> list[Turn]:
+    """Parse a JSONL session file into a list of Turns."""
+    return list(iter_session_turns(jsonl_path, truncate=truncate))
 
 
 # =============================================================================
 # TEXT RENDERER
 # =============================================================================
 
-def fmt_date(dt: datetime) -> str:
-    """Format datetime as 'Feb 4, 2026 4:16 PM' (no seconds, no timezone)."""
-    local = dt.astimezone(_local_tz())
-    month = local.strftime("%b")
-    day = local.day
-    year = local.year
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def fmt_date(dt: datetime, tz: tzinfo | None = None) -> str:
+    """Format datetime as 'Feb 4, 2026 4:16 PM' (no seconds, no timezone).
+
+    tz defaults to the local timezone; renderers pass it in once per pass.
+    """
+    local = dt.astimezone(tz or _local_tz())
     hour = local.hour % 12 or 12
-    minute = local.strftime("%M")
-    ampm = local.strftime("%p")
-    return f"{month} {day}, {year} {hour}:{minute} {ampm}"
+    ampm = "AM" if local.hour < 12 else "PM"
+    return f"{_MONTHS[local.month - 1]} {local.day}, {local.year} {hour}:{local.minute:02d} {ampm}"
 
 
-def _fmt_timestamp_full(dt: datetime | None) -> str:
+def _fmt_timestamp_full(dt: datetime | None, tz: tzinfo | None = None) -> str:
     """Format datetime as 'Feb 4, 2026 4:16:30 PM EST'."""
     if dt is None:
         return ""
-    local = dt.astimezone(_local_tz())
-    second = local.strftime("%S")
-    tz = local.strftime("%Z")
-    base = fmt_date(dt)
-    # Insert seconds after minute: "... 4:16 PM" -> "... 4:16:30 PM EST"
-    return base.replace(f" {local.strftime('%p')}", f":{second} {local.strftime('%p')} {tz}")
+    # Only whole seconds are shown, and a tool call and its result usually land in
+    # the same second, so formatting is memoized per second
+    return _fmt_epoch_second(int(dt.timestamp()), tz or _local_tz())
+
+
+@functools.lru_cache(maxsize=4096)
+def _fmt_epoch_second(epoch_second: int, tz: tzinfo) -> str:
+    local = datetime.fromtimestamp(epoch_second, tz)
+    hour = local.hour % 12 or 12
+    ampm = "AM" if local.hour < 12 else "PM"
+    return (
+        f"{_MONTHS[local.month - 1]} {local.day}, {local.year} "
+        f"{hour}:{local.minute:02d}:{local.second:02d} {ampm} {local.tzname() or ''}"
+    )
 
 
 _TEXT_WIDTH = 80
 _TEXT_RULE = "_" * _TEXT_WIDTH
 
 
-def render_text(turns: list[Turn]) -> str:
-    """Render turns as plain text."""
-    # Build tool_use_id -> tool_name map
-    tool_use_to_name: dict[str, str] = {}
-    for turn in turns:
-        for b in turn.blocks:
-            if b.tool_use_id and b.kind == "tool_use":
-                tool_use_to_name[b.tool_use_id] = b.tool_name
+# Per-kind block renderers for the text format. Each appends its lines (plus the
+# trailing blank separator) to `lines`; tool_names maps tool_use_id -> tool name.
+
+def _text_content(block: Block, lines: list[str], tool_names: dict[str, str]) -> None:
+    lines.extend((block.content, ""))
+
+
+def _text_thinking(block: Block, lines: list[str], tool_names: dict[str, str]) -> None:
+    lines.extend((f"[thinking] {block.content}", ""))
+
+
+def _text_image(block: Block, lines: list[str], tool_names: dict[str, str]) -> None:
+    lines.extend((f"[image: {block.content}]", ""))
 
-    lines: list[str] = []
 
+def _text_tool_use(block: Block, lines: list[str], tool_names: dict[str, str]) -> None:
+    append = lines.append
+    extend = lines.extend
+    tool_id = f" · {block.tool_use_id}" if block.tool_use_id else ""
+    extend((block.tool_name + tool_id, ""))
+    prefix = " | "
+    for arg in block.tool_args:
+        append(arg.name + ":")
+        extend([prefix + val_line for val_line in arg.value.splitlines()])
+        append("")
+
+
+def _text_tool_result(block: Block, lines: list[str], tool_names: dict[str, str]) -> None:
+    tool_name = tool_names.get(block.tool_use_id, "")
+    tool_id = f" · {block.tool_use_id}" if block.tool_use_id else ""
+    if _is_blank(block.content):
+        if tool_name or tool_id:
+            lines.append(f"{tool_name}{tool_id}")
+        lines.extend(("(empty response)", ""))
+    else:
+        if tool_name or tool_id:
+            lines.extend((f"{tool_name}{tool_id}", ""))
+        if block.kind == "tool_result_error":
+            lines.extend((f"[error] {block.content}", ""))
+        else:
+            lines.extend((block.content, ""))
+
+
+def _text_snapshot(block: Block, lines: list[str], tool_names: dict[str, str]) -> None:
+    for sf in block.snapshot_files:
+        parts = [sf["name"]]
+        if sf.get("version"):
+            parts.append(f"v{sf['version']}")
+        if sf.get("backupTime"):
+            parts.append(str(sf["backupTime"]))
+        if sf.get("backupFileName"):
+            parts.append(str(sf["backupFileName"]))
+        lines.append(" · ".join(parts))
+    lines.append("")
+
+
+def _text_task(block: Block, lines: list[str], tool_names: dict[str, str]) -> None:
+    # operation is already in subheader, just show content
+    task_lines = block.content.split("\n", 1)
+    if len(task_lines) > 1 and not _is_blank(task_lines[1]):
+        lines.extend((task_lines[1], ""))
+
+
+_TEXT_BLOCK_RENDERERS = {
+    "text": _text_content,
+    "thinking": _text_thinking,
+    "image": _text_image,
+    "tool_use": _text_tool_use,
+    "tool_result": _text_tool_result,
+    "tool_result_error": _text_tool_result,
+    "system": _text_content,
+    "snapshot": _text_snapshot,
+    "summary": _text_content,
+    "task": _text_task,
+}
+
+
+def _iter_text_lines(turns: Iterable[Turn]) -> Iterator[str]:
+    """Yield the plain-text rendering of turns line by line (without newlines).
+
+    turns is consumed in a single pass, so it may be a lazy iterator.
+    """
+    # tool_use_id -> tool_name, filled in as invocations stream past
+    # (a tool_result always comes after the tool_use it answers)
+    tool_use_to_name: dict[str, str] = {}
+
+    tz = _local_tz()
     for turn in turns:
+        # Lines are buffered per turn only, so memory stays bounded by the largest turn
+        lines: list[str] = []
+        append = lines.append
+
         # Header line 1: SPEAKER · timestamp              ids
-        ts = _fmt_timestamp_full(turn.timestamp)
+        ts = _fmt_timestamp_full(turn.timestamp, tz)
         left = f"{turn.speaker} · {ts}" if ts else turn.speaker
         ids = ""
         if turn.session_id:
             ids = turn.session_id[:8]
             if turn.uuid:
                 ids += f" · {turn.uuid[:8]}"
-        lines.append(_TEXT_RULE)
+        append(_TEXT_RULE)
         if ids:
             pad = max(_TEXT_WIDTH - len(left) - len(ids), 1)
-            lines.append(f"{left}{' ' * pad}{ids}")
+            append(f"{left}{' ' * pad}{ids}")
         else:
-            lines.append(left)
+            append(left)
 
         # Subheader: model/stop_reason or task operation (left), cwd (right)
         sub_left = ""
@@ -326,89 +464,58 @@ def render_text(turns: list[Turn]) -> str:
 
         if sub_left and turn.cwd:
             pad = max(_TEXT_WIDTH - len(sub_left) - len(turn.cwd), 1)
-            lines.append(f"{sub_left}{' ' * pad}{turn.cwd}")
+            append(f"{sub_left}{' ' * pad}{turn.cwd}")
         elif sub_left:
-            lines.append(sub_left)
+            append(sub_left)
         elif turn.cwd:
-            lines.append(f"{turn.cwd:>{_TEXT_WIDTH}}")
+            append(f"{turn.cwd:>{_TEXT_WIDTH}}")
 
-        lines.append("")
+        append("")
 
         for block in turn.blocks:
-            if block.kind == "text":
-                lines.append(block.content)
-                lines.append("")
-
-            elif block.kind == "thinking":
-                lines.append(f"[thinking] {block.content}")
-                lines.append("")
-
-            elif block.kind == "image":
-                lines.append(f"[image: {block.content}]")
-                lines.append("")
-
-            elif block.kind == "tool_use":
-                tool_id = f" · {block.tool_use_id}" if block.tool_use_id else ""
-                lines.append(f"{block.tool_name}{tool_id}")
-                lines.append("")
-                for arg in block.tool_args:
-                    lines.append(f"{arg.name}:")
-                    for val_line in arg.value.splitlines():
-                        lines.append(f" | {val_line}")
-                    lines.append("")
-
-            elif block.kind in ("tool_result", "tool_result_error"):
-                tool_name = tool_use_to_name.get(block.tool_use_id, "")
-                tool_id = f" · {block.tool_use_id}" if block.tool_use_id else ""
-                if not block.content.strip():
-                    if tool_name or tool_id:
-                        lines.append(f"{tool_name}{tool_id}")
-                    lines.append("(empty response)")
-                    lines.append("")
-                else:
-                    if tool_name or tool_id:
-                        lines.append(f"{tool_name}{tool_id}")
-                        lines.append("")
-                    if block.kind == "tool_result_error":
-                        lines.append(f"[error] {block.content}")
-                    else:
-                        lines.append(block.content)
-                    lines.append("")
-
-            elif block.kind == "system":
-                lines.append(block.content)
-                lines.append("")
-
-            elif block.kind == "snapshot":
-                for sf in block.snapshot_files:
-                    parts = [sf["name"]]
-                    if sf.get("version"):
-                        parts.append(f"v{sf['version']}")
-                    if sf.get("backupTime"):
-                        parts.append(str(sf["backupTime"]))
-                    if sf.get("backupFileName"):
-                        parts.append(str(sf["backupFileName"]))
-                    lines.append(" · ".join(parts))
-                lines.append("")
-
-            elif block.kind == "summary":
-                lines.append(block.content)
-                lines.append("")
-
-            elif block.kind == "task":
-                # operation is already in subheader, just show content
-                task_lines = block.content.split("\n", 1)
-                if len(task_lines) > 1 and task_lines[1].strip():
-                    lines.append(task_lines[1])
-                    lines.append("")
-
-    return "\n".join(lines)
+            if block.kind == "tool_use" and block.tool_use_id:
+                tool_use_to_name[block.tool_use_id] = block.tool_name
+            render_block = _TEXT_BLOCK_RENDERERS.get(block.kind)
+            if render_block is not None:
+                render_block(block, lines, tool_use_to_name)
+
+        yield from lines
+
+
+def render_text(turns: Iterable[Turn]) -> str:
+    """Render turns as plain text."""
+    return "\n".join(_iter_text_lines(turns))
+
+
+def render_text_to_file(turns: Iterable[Turn], output_path: str) -> None:
+    """Render turns as plain text straight to a file, without building the full string."""
+    with open(output_path, "w") as f:
+        sep = ""
+        for chunk in batched(_iter_text_lines(turns), 1000):
+            f.write(sep)
+            f.write("\n".join(chunk))
+            sep = "\n"
 
 
 # =============================================================================
 # HTML RENDERER
 # =============================================================================
 
+# Escaping uses html.escape on purpose: its chained str.replace calls are C-level scans
+# that return the input untouched when nothing matches. A str.translate table with
+# multi-char replacements falls off CPython's fast path and measured ~30x slower on
+# markup-heavy tool output (and ~7x slower on short strings).
+#
+# Most content has nothing to escape, though, and five `in` probes (memchr-backed)
+# are ~30x cheaper than five no-op replace passes over long prose. A regex search for
+# the same character class was slower than html.escape itself.
+
+def _escape(s: str) -> str:
+    if "&" in s or "<" in s or ">" in s or '"' in s or "'" in s:
+        return escape(s)
+    return s
+
+
 HTML_TEMPLATE = """\
 <!DOCTYPE html>
 <html lang="en">
@@ -417,7 +524,7 @@ HTML_TEMPLATE = """\
 <meta name="viewport" content="width=device-width, initial-scale=1">
 <title>{title}</title>
 <style>
-:root {{
+:root {
   --bg: #1a1a2e;
   --surface: #16213e;
   --surface-alt: #0f3460;
@@ -433,78 +540,78 @@ HTML_TEMPLATE = """\
   --thinking: #666;
   --border: #2a2a4a;
   --code-bg: #0d1117;
-}}
-* {{ margin: 0; padding: 0; box-sizing: border-box; }}
-body {{
+}
+* { margin: 0; padding: 0; box-sizing: border-box; }
+body {
   font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif;
   background: var(--bg);
   color: var(--text);
   line-height: 1.6;
   padding: 0;
-}}
-.container {{
+}
+.container {
   max-width: 900px;
   margin: 0 auto;
   padding: 20px;
-}}
-h1 {{
+}
+h1 {
   font-size: 1.2em;
   color: var(--text-dim);
   padding: 16px 0;
   border-bottom: 1px solid var(--border);
   margin-bottom: 20px;
   font-weight: 400;
-}}
-.turn {{
+}
+.turn {
   margin-bottom: 12px;
   padding: 12px 16px;
   border-radius: 6px;
   border-left: 3px solid transparent;
-}}
-.turn-user {{
+}
+.turn-user {
   background: rgba(255, 255, 255, 0.06);
   border-left-color: var(--user);
-}}
-.turn-claude {{
+}
+.turn-claude {
   background: rgba(222, 115, 86, 0.06);
   border-left-color: var(--claude);
-}}
-.turn-tool {{
+}
+.turn-tool {
   background: rgba(86, 182, 194, 0.06);
   border-left-color: var(--tool);
-}}
-.turn-system {{
+}
+.turn-system {
   background: rgba(90, 90, 122, 0.04);
   border-left-color: var(--system);
-}}
-.turn-snapshot {{
+}
+.turn-snapshot {
   background: rgba(182, 104, 205, 0.04);
   border-left-color: var(--snapshot);
-}}
-.turn-summary {{
+}
+.turn-summary {
   background: rgba(212, 166, 86, 0.04);
   border-left-color: var(--summary);
-}}
-.turn-task {{
+}
+.turn-task {
   background: rgba(86, 184, 122, 0.04);
   border-left-color: var(--task);
-}}
-.turn-header {{
+}
+.turn-header {
   display: flex;
   justify-content: space-between;
   align-items: flex-start;
   margin-bottom: 6px;
-}}
-.turn-header-left {{
+}
+.turn-header-left {
   display: flex;
   flex-direction: column;
-}}
-.turn-header-row {{
+}
+.turn-header-row {
   display: flex;
   align-items: baseline;
   gap: 10px;
-}}
-.turn-meta {{
+}
+.turn-meta {
   font-size: 0.65em;
   color: #556;
   font-family: "SF Mono", "Fira Code", monospace;
@@ -512,82 +619,82 @@ h1 {{
   display: flex;
   flex-direction: column;
   align-items: flex-end;
-}}
-.speaker {{
+}
+.speaker {
   font-weight: 700;
   font-size: 0.8em;
   text-transform: uppercase;
   letter-spacing: 0.05em;
-}}
-.speaker-model {{
+}
+.speaker-model {
   font-size: 0.6em;
   color: #556;
   font-family: "SF Mono", "Fira Code", monospace;
   margin-bottom: 4px;
-}}
-.speaker-user {{ color: var(--user); }}
-.speaker-claude {{ color: var(--claude); }}
-.speaker-tool {{ color: var(--tool); }}
-.speaker-system {{ color: var(--system); }}
-.speaker-snapshot {{ color: var(--snapshot); }}
-.speaker-summary {{ color: var(--summary); }}
-.speaker-task {{ color: var(--task); }}
-.timestamp {{
+}
+.speaker-user { color: var(--user); }
+.speaker-claude { color: var(--claude); }
+.speaker-tool { color: var(--tool); }
+.speaker-system { color: var(--system); }
+.speaker-snapshot { color: var(--snapshot); }
+.speaker-summary { color: var(--summary); }
+.speaker-task { color: var(--task); }
+.timestamp {
   font-size: 0.75em;
   color: var(--text-dim);
   font-family: "SF Mono", "Fira Code", monospace;
-}}
-.block {{ margin-bottom: 8px; }}
-.block:last-child {{ margin-bottom: 0; }}
-.block-text {{
+}
+.block { margin-bottom: 8px; }
+.block:last-child { margin-bottom: 0; }
+.block-text {
   white-space: pre-wrap;
   word-wrap: break-word;
-}}
-.block-thinking {{
+}
+.block-thinking {
   border-radius: 4px;
   padding: 4px 0;
   font-size: 0.8em;
   color: #777;
   white-space: pre-wrap;
   word-wrap: break-word;
-}}
-.block-tool-use {{
+}
+.block-tool-use {
   font-family: "SF Mono", "Fira Code", monospace;
   font-size: 0.85em;
-}}
-.tool-header {{
+}
+.tool-header {
   display: flex;
   align-items: baseline;
   gap: 8px;
   margin-bottom: 6px;
-}}
-.tool-name {{
+}
+.tool-name {
   color: #79c0ff;
   font-weight: 600;
-}}
-.tool-use-id {{
+}
+.tool-use-id {
   color: #556;
   font-weight: 400;
   font-size: 0.8em;
-}}
-.tool-link {{
+}
+.tool-link {
   color: #556;
   text-decoration: none;
-}}
-.tool-link:hover {{
+}
+.tool-link:hover {
   text-decoration: underline;
-}}
-.tool-arg {{
+}
+.tool-arg {
   background: var(--code-bg);
   border: 1px solid var(--border);
   border-radius: 4px;
   margin-bottom: 4px;
   overflow: hidden;
-}}
-.tool-arg:last-child {{
+}
+.tool-arg:last-child {
   margin-bottom: 0;
-}}
-.tool-arg-name {{
+}
+.tool-arg-name {
   background: rgba(255, 255, 255, 0.05);
   color: #999;
   font-size: 0.75em;
@@ -596,14 +703,14 @@ h1 {{
   letter-spacing: 0.05em;
   padding: 3px 10px;
   border-bottom: 1px solid var(--border);
-}}
-.tool-arg-value {{
+}
+.tool-arg-value {
   padding: 6px 10px;
   white-space: pre-wrap;
   word-wrap: break-word;
   color: #c9d1d9;
-}}
-.block-result {{
+}
+.block-result {
   background: var(--code-bg);
   border: 1px solid var(--border);
   border-radius: 4px;
@@ -615,12 +722,12 @@ h1 {{
   color: #8b949e;
   max-height: 300px;
   overflow-y: auto;
-}}
-.block-result-error {{
+}
+.block-result-error {
   border-color: rgba(233, 69, 96, 0.4);
   color: #f85149;
-}}
-.block-result-error::before {{
+}
+.block-result-error::before {
   content: "error";
   display: block;
   font-size: 0.7em;
@@ -628,51 +735,51 @@ h1 {{
   letter-spacing: 0.1em;
   color: var(--user);
   margin-bottom: 4px;
-}}
-.block-image {{
+}
+.block-image {
   color: var(--text-dim);
   font-style: italic;
-}}
-.block-system {{
+}
+.block-system {
   font-family: "SF Mono", "Fira Code", monospace;
   font-size: 0.82em;
   color: var(--text-dim);
-}}
-.block-snapshot {{
+}
+.block-snapshot {
   font-family: "SF Mono", "Fira Code", monospace;
   font-size: 0.82em;
   color: var(--text-dim);
-}}
-.snapshot-file {{
+}
+.snapshot-file {
   display: flex;
   gap: 16px;
   padding: 2px 0;
-}}
-.snapshot-file-name {{
+}
+.snapshot-file-name {
   color: #c9d1d9;
-}}
-.snapshot-file-meta {{
+}
+.snapshot-file-meta {
   color: #666;
   font-size: 0.9em;
-}}
-.block-summary {{
+}
+.block-summary {
   color: var(--text-dim);
   font-style: italic;
-}}
-.block-task {{
+}
+.block-task {
   font-family: "SF Mono", "Fira Code", monospace;
   font-size: 0.82em;
-}}
-.task-operation {{
+}
+.task-operation {
   color: #79c0ff;
   font-weight: 600;
   margin-bottom: 4px;
-}}
-.task-content {{
+}
+.task-content {
   color: var(--text-dim);
   white-space: pre-wrap;
   word-wrap: break-word;
-}}
+}
 </style>
 </head>
 <body>
@@ -684,182 +791,281 @@ h1 {{
 </html>
 """
 
+# HTML_TEMPLATE is never passed through str.format: it is split once at import around
+# its {title} and {body} placeholders, and render_html_to writes the pieces around the
+# escaped title and the body fragments. Body fragments are newline-terminated, so the
+# newline after {body} goes with the placeholder.
+_html_before_body, _HTML_TAIL = HTML_TEMPLATE.split("{body}\n")
+_HTML_HEAD, _HTML_TITLE_TO_H1, _HTML_H1_TO_BODY = _html_before_body.split("{title}")
+
+
+# Static markup opening every turn header, up to the speaker label
+_HTML_TURN_HEADER_OPEN = (
+    '<div class="turn-header">\n'
+    '<div class="turn-header-left">\n'
+    '<div class="turn-header-row">\n'
+)
+
+
+def _html_speaker_fragments(speaker: str) -> tuple[str, str]:
+    """Return the markup around a turn's optional id attribute for a speaker.
+
+    The first fragment is the turn div's opening tag up to its id; the second closes
+    that tag and opens the header through the speaker label.
+    """
+    speaker_lower = speaker.lower()
+    return (
+        f'<div class="turn turn-{speaker_lower}"',
+        f'>\n{_HTML_TURN_HEADER_OPEN}<span class="speaker speaker-{speaker_lower}">{_escape(speaker)}</span>\n',
+    )
+
+
+# Speakers produced by parse_entry; anything else is formatted on the fly
+_HTML_SPEAKER_FRAGMENTS = {
+    speaker: _html_speaker_fragments(speaker)
+    for speaker in ("USER", "CLAUDE", "TOOL", "SYSTEM", "SNAPSHOT", "SUMMARY", "TASK")
+}
+
+
+@dataclass(frozen=True, slots=True)
+class _ToolLinks:
+    """tool_use_id cross-references between invocations and their results."""
+    use_to_uuid: dict[str, str] = field(default_factory=dict)  # -> uuid of invoking turn
+    use_to_name: dict[str, str] = field(default_factory=dict)  # -> tool name
+    result_to_uuid: dict[str, str] = field(default_factory=dict)  # -> uuid of result turn
+
+
+# Per-kind block renderers for the HTML format. Each writes its newline-terminated
+# fragments through `w`; links resolves cross-references between tool calls and results.
+
+def _html_text(block: Block, w: Callable[[str], object], links: _ToolLinks) -> None:
+    w(f'<div class="block block-text">{_escape(block.content)}</div>\n')
+
+
+def _html_thinking(block: Block, w: Callable[[str], object], links: _ToolLinks) -> None:
+    w(f'<div class="block block-thinking">{_escape(block.content)}</div>\n')
+
+
+def _html_image(block: Block, w: Callable[[str], object], links: _ToolLinks) -> None:
+    w(f'<div class="block block-image">[Image: {_escape(block.content)}]</div>\n')
+
+
+def _html_tool_use(block: Block, w: Callable[[str], object], links: _ToolLinks) -> None:
+    w('<div class="block block-tool-use">\n')
+    w(f'<div class="tool-header"><span class="tool-name">{_escape(block.tool_name)}</span>\n')
+    if block.tool_use_id:
+        w(f'<span class="tool-use-id">{_escape(block.tool_use_id)}</span>\n')
+        if block.tool_use_id in links.result_to_uuid:
+            target = _escape(links.result_to_uuid[block.tool_use_id])
+            w(f'<span class="tool-use-id">&middot; <a class="tool-link" href="#{target}">response &#x2193;</a></span>\n')
+    w('</div>\n')
+    for arg in block.tool_args:
+        w('<div class="tool-arg">\n')
+        w(f'<div class="tool-arg-name">{_escape(arg.name)}</div>\n')
+        w(f'<div class="tool-arg-value">{_escape(arg.value)}</div>\n')
+        w('</div>\n')
+    w('</div>\n')
+
+
+def _html_tool_result(block: Block, w: Callable[[str], object], links: _ToolLinks) -> None:
+    w('<div class="block block-tool-use">\n')
+    tool_name = links.use_to_name.get(block.tool_use_id, "")
+    w('<div class="tool-header">\n')
+    if tool_name:
+        w(f'<span class="tool-name">{_escape(tool_name)}</span>\n')
+    if block.tool_use_id:
+        w(f'<span class="tool-use-id">{_escape(block.tool_use_id)}</span>\n')
+        if block.tool_use_id in links.use_to_uuid:
+            target = _escape(links.use_to_uuid[block.tool_use_id])
+            w(f'<span class="tool-use-id">&middot; <a class="tool-link" href="#{target}">invocation &#x2191;</a></span>\n')
+    w('</div>\n')
+    if _is_blank(block.content):
+        w('<div class="block block-image"><em>empty response</em></div>\n')
+    elif block.kind == "tool_result_error":
+        w(f'<div class="block block-result block-result-error">{_escape(block.content)}</div>\n')
+    else:
+        w(f'<div class="block block-result">{_escape(block.content)}</div>\n')
+    w('</div>\n')
+
+
+def _html_system(block: Block, w: Callable[[str], object], links: _ToolLinks) -> None:
+    w(f'<div class="block block-system">{_escape(block.content)}</div>\n')
+
+
+def _html_snapshot(block: Block, w: Callable[[str], object], links: _ToolLinks) -> None:
+    w('<div class="block block-snapshot">\n')
+    for sf in block.snapshot_files:
+        name = _escape(sf.get("name", ""))
+        version = sf.get("version", "")
+        backup_time = sf.get("backupTime", "")
+        backup_file = sf.get("backupFileName")
+        meta = f"v{version}" if version else ""
+        if backup_time:
+            meta += f" &middot; {_escape(str(backup_time))}"
+        if backup_file:
+            meta += f" &middot; {_escape(str(backup_file))}"
+        w(f'<div class="snapshot-file"><span class="snapshot-file-name">{name}</span><span class="snapshot-file-meta">{meta}</span></div>\n')
+    w('</div>\n')
+
+
+def _html_summary(block: Block, w: Callable[[str], object], links: _ToolLinks) -> None:
+    w(f'<div class="block block-summary">{_escape(block.content)}</div>\n')
+
+
+def _html_task(block: Block, w: Callable[[str], object], links: _ToolLinks) -> None:
+    # content is "operation\ncontent" or just "operation"
+    task_lines = block.content.split("\n", 1)
+    op = _escape(task_lines[0])
+    content = _escape(task_lines[1]) if len(task_lines) > 1 else ""
+    w('<div class="block block-task">\n')
+    w(f'<div class="task-operation">{op}</div>\n')
+    if content:
+        w(f'<div class="task-content">{content}</div>\n')
+    w('</div>\n')
+
+
+_HTML_BLOCK_RENDERERS = {
+    "text": _html_text,
+    "thinking": _html_thinking,
+    "image": _html_image,
+    "tool_use": _html_tool_use,
+    "tool_result": _html_tool_result,
+    "tool_result_error": _html_tool_result,
+    "system": _html_system,
+    "snapshot": _html_snapshot,
+    "summary": _html_summary,
+    "task": _html_task,
+}
+
 
 def render_html(turns: list[Turn], title: str = "Conversation") -> str:
     """Render turns as an HTML document."""
+    buf = io.StringIO()
+    render_html_to(buf, turns, title=title)
+    return buf.getvalue()
+
+
+def render_html_to(fp: TextIO, turns: list[Turn], title: str = "Conversation") -> None:
+    """Render turns as an HTML document, writing it to fp piece by piece."""
     # Build tool_use_id -> uuid/name maps for cross-linking
-    tool_use_to_uuid: dict[str, str] = {}  # tool_use_id -> uuid of invoking turn
-    tool_use_to_name: dict[str, str] = {}  # tool_use_id -> tool name
-    tool_result_to_uuid: dict[str, str] = {}  # tool_use_id -> uuid of result turn
+    links = _ToolLinks()
+    tool_use_to_uuid = links.use_to_uuid
+    tool_use_to_name = links.use_to_name
+    tool_result_to_uuid = links.result_to_uuid
     for turn in turns:
         for b in turn.blocks:
-            if b.tool_use_id and b.kind == "tool_use":
-                tool_use_to_uuid[b.tool_use_id] = turn.uuid
-                tool_use_to_name[b.tool_use_id] = b.tool_name
-            elif b.tool_use_id and b.kind in ("tool_result", "tool_result_error"):
-                tool_result_to_uuid[b.tool_use_id] = turn.uuid
-
-    parts: list[str] = []
-
+            tool_use_id = b.tool_use_id
+            if not tool_use_id:
+                continue
+            kind = b.kind
+            if kind == "tool_use":
+                tool_use_to_uuid[tool_use_id] = turn.uuid
+                tool_use_to_name[tool_use_id] = b.tool_name
+            elif kind == "tool_result" or kind == "tool_result_error":
+                tool_result_to_uuid[tool_use_id] = turn.uuid
+
+    tz = _local_tz()
+    title = _escape(title)
+    w = fp.write
+    w(_HTML_HEAD)
+    w(title)
+    w(_HTML_TITLE_TO_H1)
+    w(title)
+    w(_HTML_H1_TO_BODY)
+
+    get_renderer = _HTML_BLOCK_RENDERERS.get
     for turn in turns:
-        speaker_lower = turn.speaker.lower()
-        turn_id = f' id="{escape(turn.uuid)}"' if turn.uuid else ""
-        parts.append(f'<div class="turn turn-{speaker_lower}"{turn_id}>')
-        parts.append(f'<div class="turn-header">')
-        parts.append(f'<div class="turn-header-left">')
-        parts.append(f'<div class="turn-header-row">')
-        parts.append(f'<span class="speaker speaker-{speaker_lower}">{escape(turn.speaker)}</span>')
-        ts_str = _fmt_timestamp_full(turn.timestamp)
+        speaker = turn.speaker
+        turn_open, header_open = _HTML_SPEAKER_FRAGMENTS.get(speaker) or _html_speaker_fragments(speaker)
+        w(turn_open)
+        if turn.uuid:
+            w(f' id="{_escape(turn.uuid)}"')
+        w(header_open)
+        ts_str = _fmt_timestamp_full(turn.timestamp, tz)
         if ts_str:
-            parts.append(f'<span class="timestamp">{escape(ts_str)}</span>')
-        parts.append('</div>')
+            w(f'<span class="timestamp">{_escape(ts_str)}</span>\n')
+        w('</div>\n')
         if turn.model:
-            parts.append(f'<div class="speaker-model">{escape(turn.model)}</div>')
-        parts.append('</div>')
+            w(f'<div class="speaker-model">{_escape(turn.model)}</div>\n')
+        w('</div>\n')
         # Right-aligned metadata (stop_reason, session_id, cwd)
         meta_items = []
         if turn.stop_reason:
-            meta_items.append(f'<span>{escape(turn.stop_reason)}</span>')
+            meta_items.append(f'<span>{_escape(turn.stop_reason)}</span>')
         if turn.session_id:
-            sid = escape(turn.session_id[:8])
+            sid = _escape(turn.session_id[:8])
             if turn.uuid:
-                sid += f" &middot; {escape(turn.uuid[:8])}"
+                sid += f" &middot; {_escape(turn.uuid[:8])}"
             meta_items.append(f'<span>{sid}</span>')
         if turn.cwd:
-            meta_items.append(f'<span>{escape(turn.cwd)}</span>')
+            meta_items.append(f'<span>{_escape(turn.cwd)}</span>')
         if meta_items:
-            parts.append(f'<div class="turn-meta">{"".join(meta_items)}</div>')
-        parts.append('</div>')
+            w(f'<div class="turn-meta">{"".join(meta_items)}</div>\n')
+        w('</div>\n')
 
         for block in turn.blocks:
-            if block.kind == "text":
-                parts.append(f'<div class="block block-text">{escape(block.content)}</div>')
-
-            elif block.kind == "thinking":
-                parts.append(f'<div class="block block-thinking">{escape(block.content)}</div>')
-
-            elif block.kind == "image":
-                parts.append(f'<div class="block block-image">[Image: {escape(block.content)}]</div>')
-
-            elif block.kind == "tool_use":
-                parts.append('<div class="block block-tool-use">')
-                parts.append(f'<div class="tool-header"><span class="tool-name">{escape(block.tool_name)}</span>')
-                if block.tool_use_id:
-                    parts.append(f'<span class="tool-use-id">{escape(block.tool_use_id)}</span>')
-                    if block.tool_use_id in tool_result_to_uuid:
-                        target = escape(tool_result_to_uuid[block.tool_use_id])
-                        parts.append(f'<span class="tool-use-id">&middot; <a class="tool-link" href="#{target}">response &#x2193;</a></span>')
-                parts.append('</div>')
-                for arg in block.tool_args:
-                    parts.append('<div class="tool-arg">')
-                    parts.append(f'<div class="tool-arg-name">{escape(arg.name)}</div>')
-                    parts.append(f'<div class="tool-arg-value">{escape(arg.value)}</div>')
-                    parts.append('</div>')
-                parts.append('</div>')
-
-            elif block.kind in ("tool_result", "tool_result_error"):
-                parts.append('<div class="block block-tool-use">')
-                tool_name = tool_use_to_name.get(block.tool_use_id, "")
-                parts.append('<div class="tool-header">')
-                if tool_name:
-                    parts.append(f'<span class="tool-name">{escape(tool_name)}</span>')
-                if block.tool_use_id:
-                    parts.append(f'<span class="tool-use-id">{escape(block.tool_use_id)}</span>')
-                    if block.tool_use_id in tool_use_to_uuid:
-                        target = escape(tool_use_to_uuid[block.tool_use_id])
-                        parts.append(f'<span class="tool-use-id">&middot; <a class="tool-link" href="#{target}">invocation &#x2191;</a></span>')
-                parts.append('</div>')
-                if not block.content.strip():
-                    parts.append('<div class="block block-image"><em>empty response</em></div>')
-                elif block.kind == "tool_result_error":
-                    parts.append(f'<div class="block block-result block-result-error">{escape(block.content)}</div>')
-                else:
-                    parts.append(f'<div class="block block-result">{escape(block.content)}</div>')
-                parts.append('</div>')
-
-            elif block.kind == "system":
-                parts.append(f'<div class="block block-system">{escape(block.content)}</div>')
-
-            elif block.kind == "snapshot":
-                parts.append('<div class="block block-snapshot">')
-                for sf in block.snapshot_files:
-                    name = escape(sf.get("name", ""))
-                    version = sf.get("version", "")
-                    backup_time = sf.get("backupTime", "")
-                    backup_file = sf.get("backupFileName")
-                    meta = f"v{version}" if version else ""
-                    if backup_time:
-                        meta += f" &middot; {escape(str(backup_time))}"
-                    if backup_file:
-                        meta += f" &middot; {escape(str(backup_file))}"
-                    parts.append(f'<div class="snapshot-file"><span class="snapshot-file-name">{name}</span><span class="snapshot-file-meta">{meta}</span></div>')
-                parts.append('</div>')
-
-            elif block.kind == "summary":
-                parts.append(f'<div class="block block-summary">{escape(block.content)}</div>')
-
-            elif block.kind == "task":
-                # content is "operation\ncontent" or just "operation"
-                task_lines = block.content.split("\n", 1)
-                op = escape(task_lines[0])
-                content = escape(task_lines[1]) if len(task_lines) > 1 else ""
-                parts.append('<div class="block block-task">')
-                parts.append(f'<div class="task-operation">{op}</div>')
-                if content:
-                    parts.append(f'<div class="task-content">{content}</div>')
-                parts.append('</div>')
-
-        parts.append('</div>')
-
-    body = "\n".join(parts)
-    return HTML_TEMPLATE.format(title=escape(title), body=body)
+            render_block = get_renderer(block.kind)
+            if render_block:
+                render_block(block, w, links)
+
+        w('</div>\n')
+
+    w(_HTML_TAIL)
 
 
 # =============================================================================
 # PUBLIC API
 # =============================================================================
 
-def render_session(jsonl_path: str, output_path: str | None = None, truncate: bool = False) -> str:
+def render_session(jsonl_path: str, output_path: str | None = None, truncate: bool = False) -> str | None:
     """Render a full session JSONL as a readable conversation.
 
     Output format is detected from the file extension (.html for HTML, anything else for text).
-    If no output_path, returns plain text.
+    If no output_path, returns plain text; otherwise writes the file and returns None.
     """
-    turns = parse_session_turns(jsonl_path, truncate=truncate)
+    if not output_path:
+        return render_text(iter_session_turns(jsonl_path, truncate=truncate))
 
-    if output_path and output_path.endswith(".html"):
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    if output_path.endswith(".html"):
+        # HTML cross-links results to later turns, so it needs every turn up front
+        turns = parse_session_turns(jsonl_path, truncate=truncate)
         title = Path(jsonl_path).stem
-        text = render_html(turns, title=title)
+        with open(output_path, "w") as f:
+            render_html_to(f, turns, title=title)
     else:
-        text = render_text(turns)
+        render_text_to_file(iter_session_turns(jsonl_path, truncate=truncate), output_path)
+    return None
+
+
+_EPOCH = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _turn_sort_key(turn: Turn) -> datetime:
+    return turn.timestamp or _EPOCH
 
-    if output_path:
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, "w") as f:
-            f.write(text)
 
-    return text
+def _sorted_session_turns(jsonl_path: str, truncate: bool) -> list[Turn]:
+    """Parse one session for render_sessions, sorted chronologically."""
+    return sorted(parse_session_turns(jsonl_path, truncate=truncate), key=_turn_sort_key)
 
 
-def render_sessions(jsonl_paths: list[str], output_path: str, title: str = "Conversation", truncate: bool = False) -> str:
+def render_sessions(jsonl_paths: list[str], output_path: str, title: str = "Conversation", truncate: bool = False) -> None:
     """Render multiple session JSONLs interleaved by timestamp.
 
-    All turns are merged and sorted chronologically into a single output file.
+    All turns are merged and sorted chronologically and streamed into a single output file.
     """
-    all_turns: list[Turn] = []
-    for jsonl_path in jsonl_paths:
-        all_turns.extend(parse_session_turns(jsonl_path, truncate=truncate))
-
-    _epoch = datetime.min.replace(tzinfo=timezone.utc)
-    all_turns.sort(key=lambda t: t.timestamp or _epoch)
+    # Sessions parse independently, so large merges spread them across cores. Each is
+    # already (nearly) chronological, so sorting it alone is close to linear; the k-way
+    # merge then prefers earlier sessions on ties, exactly like a stable sort of the
+    # concatenation.
+    with session_mapper(jsonl_paths) as mapper:
+        per_session = list(mapper(_sorted_session_turns, jsonl_paths, repeat(truncate)))
+    merged = heapq.merge(*per_session, key=_turn_sort_key)
 
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     if output_path.endswith(".html"):
-        text = render_html(all_turns, title=title)
+        with open(output_path, "w") as f:
+            render_html_to(f, list(merged), title=title)
     else:
-        text = render_text(all_turns)
-
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write(text)
-
-    return text
+        render_text_to_file(merged, output_path)
@@ -63,19 +63,38 @@ Example:
     operations = extract_operations("session.jsonl")
 """
 
+import functools
+import hashlib
 import json
+import os
+import pickle
 import shlex
+import sys
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from pathlib import Path
 from typing import ClassVar
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decoder for JSONL lines: orjson when installed (several times faster), else stdlib.
+# Both accept str or bytes, and orjson.JSONDecodeError subclasses json.JSONDecodeError.
+json_loads = orjson.loads if orjson is not None else json.loads
+
 
 # =============================================================================
 # CONTENT BLOCKS (inside message.content list)
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TextBlock:
     """Plain text content from Claude or user."""
     type: ClassVar[str] = "text"
@@ -86,7 +105,7 @@ class TextBlock:
         return cls(text=d.get("text", ""))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThinkingBlock:
     """Claude's internal reasoning (extended thinking mode)."""
     type: ClassVar[str] = "thinking"
@@ -97,18 +116,28 @@ class ThinkingBlock:
         return cls(thinking=d.get("thinking", ""))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImageBlock:
     """Image content (screenshots, pasted images)."""
     type: ClassVar[str] = "image"
-    source: dict  # {"type": "base64", "media_type": "image/png", "data": "..."}
+    source: dict  # e.g. {"type": "base64", "media_type": "image/png"}, without "data"
+    size: int = 0  # length of the dropped base64 payload
 
     @classmethod
     def from_dict(cls, d: dict) -> "ImageBlock":
-        return cls(source=d.get("source", {}))
+        # The base64 payload is dropped here so it isn't kept alive for the whole
+        # session; only its length is recorded
+        source = dict(d.get("source", {}))
+        data = source.pop("data", "")
+        return cls(source=source, size=len(data))
 
+    @property
+    def media_type(self) -> str:
+        """e.g. "image/png"; "" if the source doesn't say."""
+        return self.source.get("media_type", "")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class ToolUseBlock:
     """Tool invocation by Claude."""
     type: ClassVar[str] = "tool_use"
@@ -125,7 +154,7 @@ class ToolUseBlock:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ToolResultBlock:
     """Result of a tool execution."""
     type: ClassVar[str] = "tool_result"
@@ -178,7 +207,7 @@ def parse_content_block(d: dict) -> ContentBlock:
 # MESSAGE (the message field of an Entry)
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TokenUsage:
     """Token consumption for a message."""
     input_tokens: int = 0
@@ -198,7 +227,7 @@ class TokenUsage:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Message:
     """A conversation message (user or assistant)."""
     role: str  # "user" or "assistant"
@@ -233,7 +262,7 @@ class Message:
 # ENTRY (a single line in the JSONL)
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Entry:
     """
     A single entry (line) in the Claude Code JSONL log.
@@ -283,8 +312,9 @@ class Entry:
         timestamp: datetime | None = None
         if timestamp_str:
             try:
-                timestamp = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
+                # fromisoformat accepts a trailing "Z" natively (3.11+)
+                timestamp = datetime.fromisoformat(timestamp_str)
+            except (ValueError, TypeError):
                 pass
 
         # Type-specific fields
@@ -329,7 +359,7 @@ class Entry:
 # UNIFIED FILE OPERATIONS (joined tool_use + tool_result)
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Read:
     """
     A file read operation.
@@ -351,7 +381,7 @@ class Read:
     is_error: bool = False     # True if the read failed
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Write:
     """
     A file write operation (full file replacement).
@@ -369,7 +399,7 @@ class Write:
     is_error: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Edit:
     """
     A single string replacement edit.
@@ -388,7 +418,7 @@ class Edit:
     replace_all: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BashCommand:
     """
     A bash command execution.
@@ -407,7 +437,7 @@ class BashCommand:
     timeout: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NotebookEdit:
     """
     Jupyter notebook cell edit.
@@ -426,7 +456,36 @@ FileOperation = Read | Write | Edit | BashCommand | NotebookEdit
 
 def list_session_files(project_dir: Path) -> list[Path]:
     """List *.jsonl files in a Claude project directory, sorted oldest first."""
-    return sorted(project_dir.glob("*.jsonl"), key=lambda p: p.stat().st_mtime)
+    # scandir's DirEntry caches its stat result, so the sort key costs one stat per file
+    with os.scandir(project_dir) as it:
+        entries = [e for e in it if e.name.endswith(".jsonl")]
+    entries.sort(key=lambda e: e.stat().st_mtime)
+    return [Path(e.path) for e in entries]
+
+
+# Worker processes start by re-importing the package (and, from the TUI, textual)
+# under the forkserver and spawn start methods, which costs a few hundred ms before
+# any work is done. Per-session jobs parse at roughly 30 MB/s, so fanning out only
+# pays once the logs add up to about a second of serial work.
+PARALLEL_MIN_BYTES = 32 * 1024 * 1024
+
+
+@contextmanager
+def session_mapper(
+    jsonl_paths: Sequence[str | Path],
+    min_bytes: int = PARALLEL_MIN_BYTES,
+) -> Iterator[Callable[..., Iterator]]:
+    """Yield a map() for per-session jobs over jsonl_paths.
+
+    It is a process pool's map when there are several sessions totalling at least
+    min_bytes of JSONL, and the builtin map otherwise. Consume the results inside
+    the with block.
+    """
+    if len(jsonl_paths) > 1 and sum(os.stat(p).st_size for p in jsonl_paths) >= min_bytes:
+        with ProcessPoolExecutor() as pool:
+            yield pool.map
+    else:
+        yield map
 
 
 def file_path_of(op: FileOperation) -> str | None:
@@ -442,6 +501,12 @@ def file_path_of(op: FileOperation) -> str | None:
 # FACTORY FUNCTION
 # =============================================================================
 
+def _intern_path(path: str) -> str:
+    """Intern a file path: a session touches a few files many times, so operations
+    share one string per path and grouping by path compares by identity."""
+    return sys.intern(path) if type(path) is str else path
+
+
 def make_file_operation(
     tool_use: ToolUseBlock,
     result_content: str,
@@ -465,7 +530,7 @@ def make_file_operation(
 
     if name == "Read":
         return Read(
-            file_path=inp.get("file_path", ""),
+            file_path=_intern_path(inp.get("file_path", "")),
             content=result_content,
             timestamp=timestamp,
             tool_use_id=tool_use.id,
@@ -476,7 +541,7 @@ def make_file_operation(
     
     elif name == "Write":
         return Write(
-            file_path=inp.get("file_path", ""),
+            file_path=_intern_path(inp.get("file_path", "")),
             content=inp.get("content", "") if not is_error else "",
             timestamp=timestamp,
             tool_use_id=tool_use.id,
@@ -485,7 +550,7 @@ def make_file_operation(
     
     elif name == "Edit":
         return Edit(
-            file_path=inp.get("file_path", ""),
+            file_path=_intern_path(inp.get("file_path", "")),
             old_string=inp.get("old_string", ""),
             new_string=inp.get("new_string", ""),
             timestamp=timestamp,
@@ -504,7 +569,7 @@ def make_file_operation(
     
     elif name == "NotebookEdit":
         return NotebookEdit(
-            notebook_path=inp.get("notebook_path", inp.get("file_path", "")),
+            notebook_path=_intern_path(inp.get("notebook_path", inp.get("file_path", ""))),
             cell_number=inp.get("cell_number", 0),
             new_source=inp.get("new_source", inp.get("source", "")),
             timestamp=timestamp,
@@ -519,36 +584,41 @@ def make_file_operation(
 # CONVENIENCE PARSER
 # =============================================================================
 
-def parse_entries(jsonl_path: str) -> list[Entry]:
+def iter_entries(jsonl_path: str) -> Iterator[Entry]:
     """
-    Parse a Claude Code session JSONL file into Entry objects.
+    Lazily parse a Claude Code session JSONL file into Entry objects.
 
     Skips blank lines, malformed JSON, and progress entries (bloated sub-agent snapshots).
 
     Args:
         jsonl_path: Path to the session .jsonl file
 
-    Returns:
-        List of Entry instances in file order
+    Yields:
+        Entry instances in file order
     """
-    entries: list[Entry] = []
-
-    with open(jsonl_path, "r", encoding="utf-8") as f:
+    # Read bytes and let the decoder handle UTF-8 and the surrounding whitespace
+    with open(jsonl_path, "rb") as f:
         for line in f:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
             try:
-                data = json.loads(line)
+                data = json_loads(line)
             except json.JSONDecodeError:
                 continue
 
             if data.get("type") == "progress":
                 continue
 
-            entries.append(Entry.from_dict(data))
+            yield Entry.from_dict(data)
+
+
+def parse_entries(jsonl_path: str) -> list[Entry]:
+    """
+    Parse a Claude Code session JSONL file into a list of Entry objects.
 
-    return entries
+    See iter_entries() for the streaming variant.
+    """
+    return list(iter_entries(jsonl_path))
 
 
 def extract_operations(jsonl_path: str) -> list[FileOperation]:
@@ -561,33 +631,127 @@ def extract_operations(jsonl_path: str) -> list[FileOperation]:
     Returns:
         List of FileOperation instances in chronological order
     """
-    entries = parse_entries(jsonl_path)
-
-    # Build tool_use_id -> (result_content, is_error) mapping
+    # One streaming pass: collect tool invocations (in order) and the
+    # tool_use_id -> (result_content, is_error) mapping side by side
+    tool_uses: list[tuple[ToolUseBlock, datetime]] = []
     results: dict[str, tuple[str, bool]] = {}
-    for entry in entries:
-        if entry.type == "user" and entry.message:
+    for entry in iter_entries(jsonl_path):
+        if not entry.message:
+            continue
+        if entry.type == "user":
             for block in entry.message.content:
                 if isinstance(block, ToolResultBlock):
                     results[block.tool_use_id] = (block.content, block.is_error)
-
-    # Extract file operations from assistant messages
-    operations: list[FileOperation] = []
-    for entry in entries:
-        if entry.type == "assistant" and entry.message:
+        elif entry.type == "assistant":
             for block in entry.message.content:
                 if isinstance(block, ToolUseBlock):
-                    result_content, is_error = results.get(block.id, ("", False))
-                    op = make_file_operation(block, result_content, entry.timestamp, is_error)
-                    if op is not None:
-                        operations.append(op)
+                    tool_uses.append((block, entry.timestamp))
+
+    # Join each invocation with its result
+    operations: list[FileOperation] = []
+    for block, timestamp in tool_uses:
+        result_content, is_error = results.get(block.id, ("", False))
+        op = make_file_operation(block, result_content, timestamp, is_error)
+        if op is not None:
+            operations.append(op)
     
     # Sort by timestamp
-    operations.sort(key=lambda op: op.timestamp)
+    operations.sort(key=attrgetter("timestamp"))
     
     return operations
 
 
+# Bump when FileOperation classes or extraction logic change, to invalidate old caches
+_OPERATIONS_CACHE_VERSION = 1
+
+# Entries not rewritten for this long are pruned, so sessions that were deleted or
+# moved don't leave their entries behind forever
+_OPERATIONS_CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+_operations_cache_pruned = False
+
+
+def _operations_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "claude-decoder" / "operations"
+
+
+def _prune_operations_cache(cache_dir: Path) -> None:
+    """Remove cache entries older than _OPERATIONS_CACHE_MAX_AGE, once per process."""
+    global _operations_cache_pruned
+    if _operations_cache_pruned:
+        return
+    _operations_cache_pruned = True
+    cutoff = time.time() - _OPERATIONS_CACHE_MAX_AGE
+    try:
+        with os.scandir(cache_dir) as it:
+            for dir_entry in it:
+                try:
+                    if dir_entry.stat().st_mtime < cutoff:
+                        os.unlink(dir_entry.path)
+                except OSError:
+                    pass  # removed concurrently or not ours to delete
+    except OSError:
+        pass
+
+
+def _reintern_paths(operations: list[FileOperation]) -> list[FileOperation]:
+    """Intern the file paths of unpickled operations, which come back as fresh strings.
+
+    The operations were just unpickled and nothing else holds them yet, so their
+    frozen path fields are set in place rather than rebuilt with replace().
+    """
+    for op in operations:
+        if isinstance(op, (Read, Write, Edit)):
+            object.__setattr__(op, "file_path", _intern_path(op.file_path))
+        elif isinstance(op, NotebookEdit):
+            object.__setattr__(op, "notebook_path", _intern_path(op.notebook_path))
+    return operations
+
+
+def extract_operations_cached(jsonl_path: str) -> list[FileOperation]:
+    """
+    extract_operations(), memoized on disk per session file.
+
+    Session logs are append-only, so a file whose mtime and size are unchanged
+    still yields the same operations. Each session has one cache entry (named
+    after its path) that is overwritten when the file changes; entries not
+    rewritten for 30 days are pruned. Any cache problem just falls back to
+    parsing.
+
+    Args:
+        jsonl_path: Path to the session .jsonl file
+
+    Returns:
+        List of FileOperation instances in chronological order
+    """
+    abs_path = os.path.abspath(jsonl_path)
+    st = os.stat(abs_path)
+    stamp = (_OPERATIONS_CACHE_VERSION, st.st_mtime_ns, st.st_size)
+    cache_path = _operations_cache_dir() / f"{hashlib.sha1(abs_path.encode()).hexdigest()}.pkl"
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_stamp, operations = pickle.load(f)
+        if cached_stamp == stamp:
+            return _reintern_paths(operations)
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass  # missing, unreadable or from an incompatible version: re-parse
+
+    operations = extract_operations(abs_path)
+
+    _prune_operations_cache(cache_path.parent)
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump((stamp, operations), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass  # read-only or full cache dir: caching is best-effort
+    return operations
+
+
 def get_file_history(operations: list[FileOperation], file_path: str) -> list[FileOperation]:
     """
     Filter operations for a specific file path.
@@ -609,10 +773,26 @@ def get_file_history(operations: list[FileOperation], file_path: str) -> list[Fi
     return result
 
 
+_SHELL_QUOTE_CHARS = ("'", '"', "\\")
+
+
 def _bash_references_path(command: str, file_path: str) -> bool:
     """Check if a bash command references a file path as an argument token."""
+    # Without quotes or escapes every shlex token is a literal substring of the command,
+    # so a command that doesn't contain the path can be ruled out without tokenizing it
+    if file_path not in command and not any(c in command for c in _SHELL_QUOTE_CHARS):
+        return False
+    dir_prefix = file_path + "/"
+    return any(token == file_path or token.startswith(dir_prefix) for token in _tokenize_bash(command))
+
+
+@functools.lru_cache(maxsize=8192)
+def _tokenize_bash(command: str) -> tuple[str, ...]:
+    """Split a bash command into shell tokens, falling back to whitespace on bad quoting.
+
+    Cached because history queries for several files re-check the same commands.
+    """
     try:
-        tokens = shlex.split(command)
+        return tuple(shlex.split(command))
     except ValueError:
-        tokens = command.split()
-    return any(token == file_path or token.startswith(file_path + "/") for token in tokens)
+        return tuple(command.split())
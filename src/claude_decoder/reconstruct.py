@@ -2,19 +2,28 @@
 """Reconstruct source files from extracted operations."""
 
 import difflib
+import heapq
+import os
 import re
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
+from operator import attrgetter
 from pathlib import Path
 
 from .models import (
     Read, Write, Edit,
-    FileOperation, file_path_of, list_session_files, extract_operations,
+    FileOperation, file_path_of, list_session_files, extract_operations_cached, session_mapper,
 )
 
 
 # Line prefix pattern: spaces + line number + → (unicode arrow)
 LINE_PREFIX = re.compile(r'^\s*\d+→', re.MULTILINE)
 
+# A non-blank line that does NOT start with the prefix ([^\S\n] is whitespace within a line)
+UNPREFIXED_LINE = re.compile(r'^(?![^\S\n]*\d+→)[^\S\n]*\S', re.MULTILINE)
+
 # System reminder tags injected by Claude Code
 SYSTEM_REMINDER = re.compile(r'\n*<system-reminder>.*?</system-reminder>\s*$', re.DOTALL)
 
@@ -27,17 +36,16 @@ def strip_line_prefixes(content: str) -> str:
     Only strips if ALL non-empty lines match the prefix pattern,
     to avoid corrupting files that legitimately contain similar text.
     """
-    lines = content.split('\n')
-    non_empty = [line for line in lines if line.strip()]
-    if not non_empty:
+    if UNPREFIXED_LINE.search(content):
         return content
-    if all(LINE_PREFIX.match(line) for line in non_empty):
-        return LINE_PREFIX.sub('', content)
-    return content
+    return LINE_PREFIX.sub('', content)
 
 
 def strip_system_reminders(content: str) -> str:
     """Remove <system-reminder> tags that leak into read content."""
+    # Most reads carry no reminder; a substring test is far cheaper than the regex scan
+    if '<system-reminder>' not in content:
+        return content
     return SYSTEM_REMINDER.sub('', content)
 
 
@@ -46,7 +54,7 @@ def _ensure_trailing_slash(path: str) -> str:
     return path if path.endswith("/") else path + "/"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileReconstruction:
     """Result of attempting to reconstruct a file."""
     path: str
@@ -114,16 +122,24 @@ def reconstruct_file(
 
     for op in file_ops[snapshot_idx + 1:]:
         if isinstance(op, Edit):
-            if op.old_string in content:
-                if not op.replace_all and content.count(op.old_string) > 1:
-                    warnings.append(
-                        f"Ambiguous edit at {op.timestamp.isoformat()}: "
-                        f"old_string appears {content.count(op.old_string)} times"
-                    )
+            old_string = op.old_string
+            idx = content.find(old_string)
+            if idx >= 0:
                 if op.replace_all:
-                    content = content.replace(op.old_string, op.new_string)
+                    content = content.replace(old_string, op.new_string)
                 else:
-                    content = content.replace(op.old_string, op.new_string, 1)
+                    end = idx + len(old_string)
+                    # Only count occurrences once a second one may exist. An empty
+                    # old_string is also "found" at the end of an empty file, so the
+                    # count still decides whether the edit is ambiguous.
+                    if content.find(old_string, end) >= 0:
+                        occurrences = content.count(old_string)
+                        if occurrences > 1:
+                            warnings.append(
+                                f"Ambiguous edit at {op.timestamp.isoformat()}: "
+                                f"old_string appears {occurrences} times"
+                            )
+                    content = content[:idx] + op.new_string + content[end:]
                 edits_applied += 1
             else:
                 edits_failed += 1
@@ -144,7 +160,7 @@ def reconstruct_file(
     )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProjectReconstruction:
     """Result of reconstructing all files in a project."""
     results: tuple[tuple[str, FileReconstruction], ...]  # (rel_path, result)
@@ -178,30 +194,39 @@ def plan_project_reconstruction(
     project_root = _ensure_trailing_slash(project_root)
     jsonl_files = list_session_files(claude_project_dir)
 
-    all_operations: list[FileOperation] = []
-    for jsonl_path in jsonl_files:
-        operations = extract_operations(str(jsonl_path))
-        all_operations.extend(operations)
+    # Sessions parse independently, so large projects spread them across cores
+    with session_mapper(jsonl_files) as mapper:
+        per_session = list(mapper(extract_operations_cached, map(str, jsonl_files)))
 
-    # Group operations by file path
+    # Each session's operations come back sorted, so a k-way merge yields them in
+    # global timestamp order (ties keep session order, as a stable sort would) and
+    # grouping then leaves every file's operations already sorted. Sessions revisit
+    # the same few paths, so the prefix test runs once per unique path: a path is
+    # either already a group or remembered as outside the project
     ops_by_file: dict[str, list[FileOperation]] = {}
-    for op in all_operations:
+    outside_root: set[str] = set()
+    for op in heapq.merge(*per_session, key=attrgetter("timestamp")):
         op_path = file_path_of(op)
-        if op_path and op_path.startswith(project_root):
-            ops_by_file.setdefault(op_path, []).append(op)
+        file_ops = ops_by_file.get(op_path)
+        if file_ops is not None:
+            file_ops.append(op)
+        elif op_path and op_path not in outside_root:
+            if op_path.startswith(project_root):
+                ops_by_file[op_path] = [op]
+            else:
+                outside_root.add(op_path)
 
-    # Reconstruct each file in memory
+    # Reconstruct each file in memory. This stays in-process: shipping every
+    # operation's content to workers and the results back costs about as much as
+    # the C-level string work it would spread out.
     results: list[tuple[str, FileReconstruction]] = []
     for file_path in sorted(ops_by_file):
-        file_ops = ops_by_file[file_path]
-        file_ops.sort(key=lambda op: op.timestamp)
-        result = reconstruct_file(file_path, file_ops)
-        rel_path = file_path[len(project_root):]
-        results.append((rel_path, result))
+        result = reconstruct_file(file_path, ops_by_file[file_path])
+        results.append((file_path[len(project_root):], result))
 
     return ProjectReconstruction(
         results=tuple(results),
-        total_operations=len(all_operations),
+        total_operations=sum(map(len, per_session)),
         session_count=len(jsonl_files),
     )
 
@@ -209,24 +234,42 @@ def plan_project_reconstruction(
 def write_reconstruction(
     reconstruction: ProjectReconstruction,
     output_dir: Path,
+    skip_unchanged: bool = True,
 ) -> None:
     """Write reconstructed files to disk.
 
     Args:
         reconstruction: Result from plan_project_reconstruction()
         output_dir: Where to write reconstructed files
+        skip_unchanged: Leave files that already hold their content untouched
     """
+    # Re-runs mostly find files already up to date, so skip rewriting those, and
+    # create each parent directory once
+    made_dirs: set[Path] = set()
     for rel_path, result in reconstruction.succeeded:
         out_path = output_dir / rel_path
-        out_path.parent.mkdir(parents=True, exist_ok=True)
+        if skip_unchanged and _file_has_content(out_path, result.content):
+            continue
+        parent = out_path.parent
+        if parent not in made_dirs:
+            parent.mkdir(parents=True, exist_ok=True)
+            made_dirs.add(parent)
         out_path.write_text(result.content)
 
 
+def _file_has_content(path: Path, content: str) -> bool:
+    """Check whether a file already holds exactly this content, byte for byte."""
+    try:
+        return path.read_bytes() == content.encode()
+    except OSError:
+        return False
+
+
 # =============================================================================
 # RESTORE PLAN
 # =============================================================================
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FileDiff:
     """Diff info for a single recovered file."""
     rel_path: str
@@ -236,7 +279,7 @@ class FileDiff:
     is_new: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RestorePlan:
     """Summary of what a restore would do."""
     reconstruction: ProjectReconstruction
@@ -256,6 +299,35 @@ class RestorePlan:
         return {f.rel_path for f in self.restorable}
 
 
+_DISK_READ_WORKERS = 16
+
+
+def _read_disk_file(path: Path) -> str | None:
+    """Read a project file for comparison, or None if it doesn't exist."""
+    if not path.exists():
+        return None
+    return path.read_text(errors="replace")
+
+
+def _count_changed_lines(old_lines: list[str], new_lines: list[str]) -> tuple[int, int]:
+    """Count (added, removed) lines between two versions of a file.
+
+    The counts are read straight off the matcher's opcodes instead of rendering a
+    unified diff.
+    """
+    # A file emptied on one side needs no matcher
+    if not old_lines or not new_lines:
+        return len(new_lines), len(old_lines)
+
+    added = removed = 0
+    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            removed += i2 - i1
+            added += j2 - j1
+    return added, removed
+
+
 def plan_restore(project_path: str, claude_dir: Path, output_dir: Path | None = None) -> RestorePlan:
     """Scan sessions and compute diff against files on disk.
 
@@ -271,28 +343,26 @@ def plan_restore(project_path: str, claude_dir: Path, output_dir: Path | None =
     matched: list[str] = []
     new_files: list[FileDiff] = []
 
-    for rel_path, result in reconstruction.succeeded:
-        disk_path = project_dir / rel_path
-        if not disk_path.exists():
-            new_files.append(FileDiff(rel_path, result, is_new=True))
-            continue
+    # Reading the on-disk copies is pure I/O (the GIL is released), so overlap it in
+    # threads; map() hands the contents back in order
+    succeeded = reconstruction.succeeded
+    with ThreadPoolExecutor(max_workers=_DISK_READ_WORKERS) as pool:
+        disk_contents = pool.map(_read_disk_file, (project_dir / rel_path for rel_path, _ in succeeded))
 
-        disk_content = disk_path.read_text(errors="replace")
-        if disk_content == result.content:
-            matched.append(rel_path)
-            continue
+        for (rel_path, result), disk_content in zip(succeeded, disk_contents):
+            if disk_content is None:
+                new_files.append(FileDiff(rel_path, result, is_new=True))
+                continue
 
-        disk_lines = disk_content.splitlines(keepends=True)
-        restored_lines = result.content.splitlines(keepends=True)
-        added = removed = 0
-        for line in difflib.unified_diff(disk_lines, restored_lines, n=0):
-            if line.startswith("+++") or line.startswith("---") or line.startswith("@@"):
+            if disk_content == result.content:
+                matched.append(rel_path)
                 continue
-            if line.startswith("+"):
-                added += 1
-            elif line.startswith("-"):
-                removed += 1
-        changed.append(FileDiff(rel_path, result, added=added, removed=removed))
+
+            added, removed = _count_changed_lines(
+                disk_content.splitlines(keepends=True),
+                result.content.splitlines(keepends=True),
+            )
+            changed.append(FileDiff(rel_path, result, added=added, removed=removed))
 
     failed = tuple(
         FileDiff(rel_path, result)
@@ -320,33 +390,73 @@ def execute_restore(plan: RestorePlan, output_dir: Path) -> int:
             if p in restorable_paths
         ),
     )
-    write_reconstruction(filtered, output_dir)
+    # Restoring in place, the plan already found every one of these files differs
+    in_place = output_dir.resolve() == Path(plan.project_path).resolve()
+    write_reconstruction(filtered, output_dir, skip_unchanged=not in_place)
     return len(restorable_paths)
 
 
+_DIFF_BINARY = shutil.which("diff")
+
+
+def _unified_diff(rel_path: str, original: Path, restored: str) -> str:
+    """Unified diff from a project file (empty if missing) to its restored content.
+
+    Uses the system diff when available: its Myers diff stays fast on large, heavily
+    changed files where difflib degrades badly, and it marks a missing final newline
+    so the patch still applies. Falls back to difflib if diff is absent or fails.
+
+    Bytes of the original that aren't valid UTF-8 decode as surrogate escapes, so
+    writing the patch with the same error handler reproduces them exactly.
+    """
+    restored_bytes = restored.encode()
+    try:
+        original_size: int | None = original.stat().st_size
+    except FileNotFoundError:
+        original_size = None
+    # Restores often include files that already match; a size check and one read rule
+    # those out without spawning diff or running difflib
+    if original_size == len(restored_bytes) and original.read_bytes() == restored_bytes:
+        return ""
+
+    from_label, to_label = f"a/{rel_path}", f"b/{rel_path}"
+    if _DIFF_BINARY is not None:
+        source = str(original) if original_size is not None else os.devnull
+        proc = subprocess.run(
+            [_DIFF_BINARY, "-u", "--label", from_label, "--label", to_label, source, "-"],
+            input=restored_bytes,
+            capture_output=True,
+        )
+        if proc.returncode < 2:  # 0: identical, 1: differences, 2: trouble
+            return proc.stdout.decode(errors="surrogateescape")
+
+    # Diff raw bytes so the original never has to decode as UTF-8
+    original_bytes = original.read_bytes() if original_size is not None else b""
+    diff = difflib.diff_bytes(
+        difflib.unified_diff,
+        original_bytes.splitlines(keepends=True),
+        restored_bytes.splitlines(keepends=True),
+        fromfile=from_label.encode(),
+        tofile=to_label.encode(),
+    )
+    return b"".join(diff).decode(errors="surrogateescape")
+
+
 def write_patch(reconstruction: ProjectReconstruction, project_path: str, patch_path: str | None = None) -> None:
     """Write reconstruction as a unified diff patch file."""
     project_dir = Path(project_path)
-    patches: list[str] = []
-
-    for rel_path, result in reconstruction.succeeded:
-        original = project_dir / rel_path
-        restored_lines = result.content.splitlines(keepends=True)
-
-        if original.exists():
-            original_lines = original.read_text().splitlines(keepends=True)
-        else:
-            original_lines = []
-
-        diff = difflib.unified_diff(
-            original_lines,
-            restored_lines,
-            fromfile=f"a/{rel_path}",
-            tofile=f"b/{rel_path}",
+    succeeded = reconstruction.succeeded
+
+    # Each diff runs in its own diff process, so threads overlap them across cores;
+    # map() keeps the hunks in path order
+    with ThreadPoolExecutor() as pool:
+        diffs = pool.map(
+            _unified_diff,
+            [rel_path for rel_path, _ in succeeded],
+            [project_dir / rel_path for rel_path, _ in succeeded],
+            [result.content for _, result in succeeded],
         )
-        diff_text = "".join(diff)
-        if diff_text:
-            patches.append(diff_text)
+        patches = [diff_text for diff_text in diffs if diff_text]
 
     if not patches:
         print("No differences found — files already match.")
@@ -354,6 +464,6 @@ def write_patch(reconstruction: ProjectReconstruction, project_path: str, patch_
 
     out = Path(patch_path) if patch_path else Path("claude-decoder-restore.patch")
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text("\n".join(patches))
+    out.write_text("\n".join(patches), encoding="utf-8", errors="surrogateescape")
     print(f"\nPatch written to {out.resolve()}")
     print(f"Apply with: cd {project_path} && git apply {out.resolve()}")